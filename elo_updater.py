@@ -0,0 +1,191 @@
+import csv
+import io
+import os
+import numpy as np
+
+# Shared by the elo_updater_<sport>.py scripts: every sport uses the same Elo
+# formulas and the same ratings/scores CSV layout, so the update lives here
+# and each script only names its files.
+
+def calculate_new_elo(AElo, HElo, ascore, hscore):
+    """
+    Calculates the new Elo ratings for the Away and Home teams based on the 
+    provided set of formulas.
+
+    Args:
+        AElo (float): Current Elo rating of the Away Team.
+        HElo (float): Current Elo rating of the Home Team.
+        ascore (int): Score of the Away Team.
+        hscore (int): Score of the Home Team.
+
+    Returns:
+        tuple: (New Elo rating for Away Team, New Elo rating for Home Team)
+    """
+
+    # 1. Expected Score for Away Team (ex)
+    # ex = 1 / (1+ 10 ** ((AElo - HElo)/400))
+    # Using np.power is robust for potential large exponents
+    if (ascore>hscore):
+        ex = 1 / (1+ 10 ** ((HElo - AElo)/400))
+    else:
+        ex = 1 / (1+ 10 ** ((AElo - HElo)/400))
+
+    # 2. Actual Score Modifier (act)
+    # act = abs((ascore - hscore) + 1) ** 0.42 * (sign(ascore - hscore))
+    act = abs((ascore - hscore) + 1) ** 0.42 * (1 if ascore - hscore > 0 else -1 if ascore - hscore < 0 else 0)
+
+    # 3. New Rating Adjustment for Away Team (nra / AElo_new)
+    # The second term is |HElo - AElo| ^ (sign(HElo - AElo) / 1000)
+    AElo_new = (AElo + 4 * (act / (ex + 0.1))) * abs(HElo - AElo) ** ( (1 if HElo - AElo > 0 else -1 if HElo - AElo < 0 else 0) / 1000 )
+
+    # 4. New Rating for Home Team (nrh / HElo_new) - Zero-sum change
+    # nrh = HElo - (nra - AElo)
+    # The change in AElo is AElo_new - AElo. This change is subtracted from HElo.
+    HElo_new = HElo - (AElo_new-AElo)
+
+    return AElo_new, HElo_new
+
+def to_numeric(values):
+    """
+    Converts a list of strings to a float array. Entries that are not valid
+    numbers become NaN instead of raising an error.
+    """
+    try:
+        # Fast path: every entry is numeric, so NumPy converts the whole list at once
+        return np.array(values, dtype=float)
+    except (TypeError, ValueError):
+        pass
+
+    numbers = np.empty(len(values))
+    for i, value in enumerate(values):
+        try:
+            numbers[i] = float(value)
+        except (TypeError, ValueError):
+            numbers[i] = np.nan
+    return numbers
+
+def process_games(ratings_file, scores_file, output_file):
+    """
+    Reads existing Elo ratings and game results, calculates new ratings,
+    and outputs a CSV with the updated ratings.
+
+    Args:
+        ratings_file (str): CSV with the current ratings ('Team' and 'Elo' columns).
+        scores_file (str): CSV with the games to apply, as written by the
+            get*scores scripts.
+        output_file (str): Where the updated ratings are saved.
+    """
+    try:
+        # Load initial Elo ratings. Rows are kept as plain lists; the columns
+        # are located once from the header row.
+        with open(ratings_file, newline='', encoding='utf-8') as csvfile:
+            reader = csv.reader(csvfile)
+            header = next(reader)
+            # Short rows are padded so every column can be read and written
+            ratings_rows = [row + [''] * (len(header) - len(row)) for row in reader if row]
+        team_col = header.index('Team')
+        elo_col = header.index('Elo')
+        # Ratings are kept in a NumPy array; team_index maps a team name to its row
+        elo = to_numeric([row[elo_col] for row in ratings_rows])
+        team_index = {row[team_col]: i for i, row in enumerate(ratings_rows)}
+
+        # Load game scores
+        with open(scores_file, newline='', encoding='utf-8') as csvfile:
+            reader = csv.reader(csvfile)
+            scores_header = next(reader)
+            scores_rows = [row + [''] * (len(scores_header) - len(row)) for row in reader if row]
+        away_team_col, home_team_col, away_score_col, home_score_col = (
+            scores_header.index(column) for column in ('away team', 'home team', 'away score', 'home score'))
+
+    except FileNotFoundError as e:
+        print(f"Error: Required file not found. Please ensure both '{ratings_file}' and '{scores_file}' are available.")
+        return
+    except (ValueError, StopIteration) as e:
+        # Updated error message to reflect the now-expected column names for both files
+        print(f"Error: The input files are missing required columns. Check if '{ratings_file}' has 'Team' and 'Elo', and '{scores_file}' has 'away team', 'home team', 'away score', and 'home score'.")
+        return
+    except Exception as e:
+        print(f"An unexpected error occurred during file loading: {e}")
+        return
+
+    # Use a set to track which teams actually played a game and had their rating updated
+    updated_teams = set()
+
+    # Convert both score columns up front; invalid entries become NaN
+    away_scores = to_numeric([row[away_score_col] for row in scores_rows])
+    home_scores = to_numeric([row[home_score_col] for row in scores_rows])
+    valid_scores = np.isfinite(away_scores) & np.isfinite(home_scores)
+
+    # Iterate through each game and calculate new ratings. Games are applied
+    # in the recorded order, so a team that plays twice (e.g. a doubleheader)
+    # starts its second game from the rating its first game produced.
+    for index, row in enumerate(scores_rows):
+        away_team = row[away_team_col]
+        home_team = row[home_team_col]
+
+        if not valid_scores[index]:
+            print(f"Skipping game {index}: Scores for {away_team} vs {home_team} are not valid numbers.")
+            continue
+
+        # Look up current Elo ratings and skip game if team is missing
+        try:
+            away_row = team_index[away_team]
+            home_row = team_index[home_team]
+        except KeyError as e:
+            print(f"Warning: Team {e} not found in '{ratings_file}'. Skipping game {away_team} vs {home_team}.")
+            continue
+
+        # Perform calculation on Python floats and ints, one game at a time
+        AElo_new, HElo_new = calculate_new_elo(float(elo[away_row]), float(elo[home_row]),
+                                               int(away_scores[index]), int(home_scores[index]))
+
+        # Update ratings array with the new values
+        elo[away_row] = AElo_new
+        elo[home_row] = HElo_new
+        updated_teams.add(away_team)
+        updated_teams.add(home_team)
+
+    # After processing all games, write the new ratings back into the rows
+    # and add a flag for updated teams
+    if 'RatingUpdated' not in header:
+        header.append('RatingUpdated')
+        for row in ratings_rows:
+            row.append('')
+    updated_col = header.index('RatingUpdated')
+    for i, row in enumerate(ratings_rows):
+        if row[team_col] in updated_teams:
+            row[elo_col] = float(elo[i])
+        row[updated_col] = row[team_col] in updated_teams
+
+    # Render the final ratings first, so that a file that would not change
+    # (e.g. no games were played) is left alone
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator='\n')
+    writer.writerow(header)
+    writer.writerows(ratings_rows)
+    new_contents = buffer.getvalue()
+
+    try:
+        with open(output_file, newline='', encoding='utf-8') as csvfile:
+            unchanged = csvfile.read() == new_contents
+    except FileNotFoundError:
+        unchanged = False
+
+    if unchanged:
+        print(f"Elo ratings in '{output_file}' are unchanged; nothing to save.")
+    else:
+        # Save the final ratings to the output CSV file. The rows are written to
+        # a temporary file next to it that then replaces the output in one step,
+        # so an interrupted run never leaves a half-written ratings file.
+        temp_file = output_file + '.tmp'
+        try:
+            with open(temp_file, 'w', newline='', encoding='utf-8') as csvfile:
+                csvfile.write(new_contents)
+            os.replace(temp_file, output_file)
+        finally:
+            # Only left over if the write or the replace failed
+            if os.path.exists(temp_file):
+                os.remove(temp_file)
+
+        print(f"Successfully calculated new Elo ratings and saved to '{output_file}'.")
+    print(f"Updated ratings for {len(updated_teams)} teams that played in the recorded games.")
@@ -0,0 +1,323 @@
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import csv
+import io
+import os
+import sys
+import re
+import unicodedata
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+# Shared by the get*scores scripts: every sport pulls from the same ESPN
+# scoreboard API and writes the same CSV layout, so the fetch -> parse ->
+# write pipeline lives here, together with the team-name matching. Each
+# script only supplies its URLs and which ratings file to match against.
+
+SCORES_HEADER = ['away team', 'home team', 'away score', 'home score']
+
+# One session for all ESPN calls: keeps the connection alive between requests
+# and retries rate limiting and transient server errors with backoff
+# (honoring Retry-After), so one flaky response doesn't lose a day of scores.
+RETRY = Retry(total=4, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504],
+              allowed_methods=frozenset(['GET']))
+SESSION = requests.Session()
+ADAPTER = HTTPAdapter(pool_connections=10, pool_maxsize=10, max_retries=RETRY)
+SESSION.mount('http://', ADAPTER)
+SESSION.mount('https://', ADAPTER)
+
+
+def build_accent_map():
+    """
+    Builds a str.translate table that maps accented Latin letters to their
+    unaccented form (e.g., é -> e) and drops stray combining marks.
+    """
+    accent_map = {}
+    # Latin-1 Supplement, Latin Extended-A/B and Latin Extended Additional
+    for start, end in ((0x00C0, 0x0250), (0x1E00, 0x1F00)):
+        for code in range(start, end):
+            base = ''.join(c for c in unicodedata.normalize('NFD', chr(code))
+                           if unicodedata.category(c) != 'Mn')
+            if base != chr(code):
+                accent_map[code] = base
+    # Combining Diacritical Marks (already-decomposed input)
+    for code in range(0x0300, 0x0370):
+        accent_map[code] = None
+    return accent_map
+
+
+ACCENT_MAP = build_accent_map()
+
+
+def strip_accents(text):
+    """Removes all accent marks from a string (e.g., José -> Jose)."""
+    if not text:
+        return text
+    return text.translate(ACCENT_MAP)
+
+
+# ESPN spellings that differ from the ratings files. 'No. ' is the ranking
+# prefix on ranked teams and is dropped. Scripts can add their own fixes.
+NAME_FIXES = {
+    'JosÃ©': 'José',
+    'San Jose': 'San José',
+    'No. ': '',
+}
+
+
+@lru_cache(maxsize=None)
+def name_fixes_pattern(fixes):
+    """Compiles one regex that matches any of the given fix strings."""
+    return re.compile('|'.join(map(re.escape, fixes)))
+
+
+def normalize_name(raw_name, name_fixes=NAME_FIXES):
+    """
+    Fixes encoding issues from the ESPN API such as 'San JosÃ©' -> 'San José'
+    and ensures consistent Unicode formatting. name_fixes maps ESPN spellings
+    to the ones used in the ratings files.
+    """
+    if not raw_name:
+        return raw_name
+
+    # Nearly every ESPN name is plain ASCII, which is already NFC, and
+    # isascii() answers that without scanning the string
+    name = raw_name
+    if not name.isascii():
+        name = unicodedata.normalize('NFC', name)
+    # All of the fixes are applied in a single pass over the name
+    pattern = name_fixes_pattern(tuple(name_fixes))
+    name = pattern.sub(lambda match: name_fixes[match.group(0)], name)
+    return name.strip()
+
+
+def load_team_names(filename, substring=False):
+    """
+    Loads the team names from the first column of a ratings CSV. Each name is
+    keyed by its lower-cased, accent-stripped form, so that is only computed
+    once.
+
+    Returns:
+        dict: key -> team name, for exact matching.
+        list: (key, team name) pairs sorted longest team name first, if
+              substring is True.
+    """
+    team_keys = {}
+    try:
+        with open(filename, newline='', encoding='utf-8') as csvfile:
+            reader = csv.reader(csvfile)
+            for row in reader:
+                if row:
+                    team = row[0].strip()
+                    if team:
+                        team_keys[team] = strip_accents(team.lower())
+    except FileNotFoundError:
+        print(f"❌ Could not find {filename}. Make sure the file exists in the data/ folder.")
+    except Exception as e:
+        print(f"Error loading team names from {filename}: {e}")
+
+    if substring:
+        return sorted(((key, team) for team, key in team_keys.items()),
+                      key=lambda pair: -len(pair[1]))
+    return {key: team for team, key in team_keys.items()}
+
+
+def clean_team_name(full_name, team_names, name_fixes=NAME_FIXES, substring=False):
+    """
+    Maps an ESPN displayName to the team name used in a ratings CSV.
+
+    Args:
+        full_name (str): The ESPN displayName.
+        team_names (dict or list): load_team_names output for the same
+            substring setting.
+        name_fixes (dict): Spelling fixes applied first, see normalize_name.
+        substring (bool): If False, the name must equal a team name (case and
+            accents ignored) and other names give None. If True, nicknames
+            are stripped (e.g., 'Georgia Bulldogs' -> 'Georgia') by taking the
+            longest team name contained in it, and other names are returned
+            normalized.
+    """
+    if not full_name:
+        return None
+
+    normalized = normalize_name(full_name, name_fixes)
+    lower_no_accents = strip_accents(normalized.lower())
+
+    if not substring:
+        return team_names.get(lower_no_accents)
+
+    # team_names is sorted longest name first, so the first match is the
+    # longest (most specific) one and the scan can stop there
+    for team_key, team in team_names:
+        if team_key in lower_no_accents:
+            return team
+
+    return normalized
+
+
+def team_name_cleaner(filename, extra_fixes=None, substring=False):
+    """
+    Builds the clean_name function for harvest_scores.
+
+    Args:
+        filename (str): Ratings CSV whose first column holds the team names.
+        extra_fixes (dict): Sport-specific spelling fixes on top of NAME_FIXES.
+        substring (bool): Match by substring instead of exactly, see
+            clean_team_name.
+
+    Returns:
+        callable: Maps an ESPN displayName to the team name in filename.
+    """
+    team_names = load_team_names(filename, substring)
+    name_fixes = {**NAME_FIXES, **(extra_fixes or {})}
+
+    # A team can show up in several events, so each displayName is only
+    # matched against the team list once per run
+    @lru_cache(maxsize=None)
+    def clean_name(name):
+        return clean_team_name(name, team_names, name_fixes, substring)
+
+    return clean_name
+
+
+def fetch_scoreboard(api_url):
+    """Requests one ESPN scoreboard URL and returns the decoded JSON."""
+    response = SESSION.get(api_url, timeout=10)
+    response.raise_for_status()
+    return response.json()
+
+
+def fetch_scoreboards(api_urls):
+    """
+    Fetches several ESPN scoreboard URLs concurrently.
+
+    Returns:
+        list: The decoded JSON for each URL, in the same order as api_urls.
+              Entries are None for URLs that could not be fetched; the error
+              is printed.
+    """
+    # The requests are independent, so run them concurrently
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        futures = [executor.submit(fetch_scoreboard, api_url) for api_url in api_urls]
+
+    results = []
+    for api_url, future in zip(api_urls, futures):
+        try:
+            results.append(future.result())
+        # A response that is not valid JSON raises requests' JSONDecodeError,
+        # which is also a RequestException
+        except requests.exceptions.RequestException as e:
+            print(f"Error fetching data from {api_url}: {e}")
+            results.append(None)
+    return results
+
+
+def harvest_scores(api_urls, clean_name=None, event_date=None):
+    """
+    Collects the final scores from one or more ESPN scoreboard URLs.
+
+    Args:
+        api_urls (list): Scoreboard URLs to fetch.
+        clean_name (callable): Maps an ESPN displayName to the team name used
+            in the ratings CSV. A game is dropped if either name maps to a
+            false value. Defaults to keeping the displayName as is.
+        event_date (str): If given ('YYYY-MM-DD'), games whose event date
+            differs are skipped.
+
+    Returns:
+        list: [away team, home team, away score, home score] rows, one per matchup.
+
+    Exits with a non-zero status, without returning any rows, if any of the
+    scoreboards could not be fetched.
+    """
+    scoreboards = fetch_scoreboards(api_urls)
+    # A failed fetch must not look like a day without games: the Elo updater
+    # would clear every RatingUpdated flag and that day's scores would be lost.
+    # Failing the job instead keeps update_elo from running on partial data.
+    if any(data is None for data in scoreboards):
+        sys.exit("Not saving scores: at least one scoreboard could not be fetched.")
+
+    all_game_data = []
+    seen_games = set()
+
+    for data in scoreboards:
+        for event in data.get('events', []):
+            # FIX: Double-check the actual event date string from the API
+            # The API event date format is usually ISO: "2024-12-21T17:00Z"
+            event_date_full = event.get('date', '')
+            if event_date and event_date_full:
+                if event_date_full.split('T')[0] != event_date:
+                    continue
+
+            competitions = event.get('competitions', [])
+            if not competitions:
+                continue
+
+            comp = competitions[0]
+            status = comp.get('status', {}).get('type', {}).get('state')
+            # State 'post' means the game is finished.
+            if status != 'post':
+                continue
+
+            away_team_name, home_team_name = None, None
+            away_score, home_score = None, None
+
+            for competitor in comp.get('competitors', []):
+                team_display_name = competitor.get('team', {}).get('displayName')
+                if clean_name:
+                    team_display_name = clean_name(team_display_name)
+                score = competitor.get('score')
+
+                if competitor.get('homeAway') == 'away':
+                    away_team_name = team_display_name
+                    away_score = int(score) if score else 0
+                elif competitor.get('homeAway') == 'home':
+                    home_team_name = team_display_name
+                    home_score = int(score) if score else 0
+
+            if away_team_name and home_team_name:
+                # Same key whichever way round the teams are listed
+                if away_team_name < home_team_name:
+                    game_id = (away_team_name, home_team_name)
+                else:
+                    game_id = (home_team_name, away_team_name)
+                if game_id not in seen_games:
+                    seen_games.add(game_id)
+                    all_game_data.append([away_team_name, home_team_name, away_score, home_score])
+
+    return all_game_data
+
+
+def write_csv(filename, header, rows):
+    """Writes a header row followed by rows to filename."""
+    # Render the whole file in memory and write it in one call. csv.writer
+    # still does the formatting, so quoting and line endings are unchanged.
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(header)
+    writer.writerows(rows)
+    # Write to a temporary file next to the output and swap it in, so an
+    # interrupted run never leaves a half-written CSV behind
+    temp_file = filename + '.tmp'
+    try:
+        with open(temp_file, 'w', newline='', encoding='utf-8') as csvfile:
+            csvfile.write(buffer.getvalue())
+        os.replace(temp_file, filename)
+    finally:
+        # Only left over if the write or the replace failed
+        if os.path.exists(temp_file):
+            os.remove(temp_file)
+
+
+def save_scores(filename, all_game_data):
+    """
+    Writes harvested scores to filename in the layout the Elo updaters read.
+    Exits with a non-zero status if the file cannot be written.
+    """
+    try:
+        write_csv(filename, SCORES_HEADER, all_game_data)
+        print(f"✅ Saved {len(all_game_data)} unique game scores to {filename}")
+    except Exception as e:
+        # Fail the job so update_elo does not run without the day's scores
+        sys.exit(f"Error writing to CSV file: {e}")
@@ -1,6 +1,5 @@
-import requests
-import csv
 from datetime import datetime, timedelta
+from espn_scoreboard import harvest_scores, save_scores
 
 def fetch_and_save_scores():
     """
@@ -23,89 +22,12 @@ def fetch_and_save_scores():
     
     print(f"Fetching NHL scores for: {file_date_str} from {API_URL}")
 
-    try:
-        # 4. Make the API request
-        response = requests.get(API_URL, timeout=10)
-        response.raise_for_status() # Raise HTTPError for bad responses (4xx or 5xx)
-        data = response.json()
-        
-    except requests.exceptions.RequestException as e:
-        print(f"Error fetching data from ESPN API: {e}")
-        return
+    # 4. Fetch the finished games. NHL display names already match the
+    # ratings file, so they are kept as is.
+    game_data = harvest_scores([API_URL])
 
-    # List to store processed game data
-    game_data = []
-
-    # The scoreboard data is typically found in the 'events' key
-    events = data.get('events', [])
-    
-    if not events:
-        print(f"No events found for {file_date_str} or the API returned no data.")
-        # Create an empty file with just the header if no data is found
-        with open(CSV_FILENAME, 'w', newline='', encoding='utf-8') as csvfile:
-            writer = csv.writer(csvfile)
-            writer.writerow(['away team', 'home team', 'away score', 'home score'])
-        print(f"Created CSV file with header: {CSV_FILENAME}")
-        return
-
-    # 5. Process the events
-    for event in events:
-        # Each event usually has one competition
-        competitions = event.get('competitions', [])
-        
-        if not competitions:
-            continue
-
-        competition = competitions[0]
-        competitors = competition.get('competitors', [])
-        
-        # Ensure the game is final before recording 
-        # State 'post' means the game is finished.
-        if competition.get('status', {}).get('type', {}).get('state') != 'post':
-            print(f"Skipping event {event.get('name')}: Game status is not 'final'.")
-            continue
-        
-        # Parse competitor data
-        away_team_name, away_score = None, None
-        home_team_name, home_score = None, None
-
-        for competitor in competitors:
-            team_info = competitor.get('team', {})
-            score = competitor.get('score')
-            
-            # The 'homeAway' key distinguishes the teams
-            if competitor.get('homeAway') == 'away':
-                away_team_name = team_info.get('displayName')
-                # Scores are returned as strings, convert to int for CSV
-                away_score = int(score) if score is not None else 0 
-            elif competitor.get('homeAway') == 'home':
-                home_team_name = team_info.get('displayName')
-                home_score = int(score) if score is not None else 0
-
-        # 6. Store the data in the required format
-        if all([away_team_name, home_team_name, away_score is not None, home_score is not None]):
-            game_data.append([
-                away_team_name,
-                home_team_name,
-                away_score,
-                home_score
-            ])
-            
-    # 7. Write the data to the CSV file
-    try:
-        with open(CSV_FILENAME, 'w', newline='', encoding='utf-8') as csvfile:
-            writer = csv.writer(csvfile)
-            
-            # Write header: away team, home team, away score, home score
-            writer.writerow(['away team', 'home team', 'away score', 'home score'])
-            
-            # Write data rows
-            writer.writerows(game_data)
-            
-        print(f"Successfully saved {len(game_data)} game scores to {CSV_FILENAME}")
-        
-    except Exception as e:
-        print(f"Error writing to CSV file: {e}")
+    # 5. Write the data to the CSV file (just the header if there were no games)
+    save_scores(CSV_FILENAME, game_data)
 
 
 if __name__ == '__main__':
@@ -1,7 +1,11 @@
-import pandas as pd
 import numpy as np
 
+# 10 ** (x / 400) == exp(x * ln(10) / 400); the constant is folded once here
+LN10_OVER_400 = np.log(10.0) / 400
+
 
 def percentage (AElo, HElo):
-  ex = 1 / (1+ 10 ** ((HElo - AElo)/400))
+  # NumPy ufuncs accept scalars, lists or arrays, so a whole slate of games
+  # can be evaluated in one call
+  ex = 1 / (1 + np.exp(np.subtract(HElo, AElo) * LN10_OVER_400))
   return ex